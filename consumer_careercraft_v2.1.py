@@ -22,6 +22,8 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import heapq
+from collections import namedtuple
 from datetime import datetime, timezone
 
 # =============================================================================
@@ -54,14 +56,29 @@ def calculate_effective_level(base_level: int, practice_freq: str) -> float:
     """Calculate effective skill level after practice frequency adjustment."""
     return min(100, base_level * practice_weight(practice_freq))
 
+# Assessment answers coded as int8 so per-skill weights are one array gather
+FREQ_CODE = {"Rarely/Never": 0, "Sometimes": 1, "Often (weekly+)": 2}
+FREQ_WEIGHT = np.array([practice_weight(freq) for freq in FREQ_CODE], dtype=np.float32)
+FREQ_OPTIONS = ("Often (weekly+)", "Sometimes", "Rarely/Never")
+
+# Readiness bands, indexed by band code (0 = below 55, 1 = 55-75, 2 = 75+)
+BAND_EDGES = np.array([55, 75])
+BAND_NAMES = np.array(["long_shot", "stretch", "balanced"])
+BAND_LABELS = np.array([
+    "Long-shot path (about 1 in 5+; consider alternatives)",
+    "Stretch path (about 1 in 3-4 if you commit seriously)",
+    "Balanced path (about 1 in 2 if you follow through)",
+])
+BAND_COLORS = np.array(["#e74c3c", "#f39c12", "#2ecc71"])
+
+def get_readiness_bands_vec(readiness):
+    """Band codes for a readiness score or array of scores; index the BAND_* arrays with them."""
+    return np.digitize(readiness, BAND_EDGES)
+
 def get_readiness_band(readiness_score: float) -> tuple:
     """Map readiness score to honest bands with '1 in X' language."""
-    if readiness_score >= 75:
-        return ("balanced", "Balanced path (about 1 in 2 if you follow through)", "#2ecc71")
-    elif readiness_score >= 55:
-        return ("stretch", "Stretch path (about 1 in 3-4 if you commit seriously)", "#f39c12")
-    else:
-        return ("long_shot", "Long-shot path (about 1 in 5+; consider alternatives)", "#e74c3c")
+    code = get_readiness_bands_vec(readiness_score)
+    return (str(BAND_NAMES[code]), str(BAND_LABELS[code]), str(BAND_COLORS[code]))
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -94,10 +111,7 @@ COLORS = {
 
 def hex_to_rgba(hex_color, alpha=0.3):
     """Convert hex color to rgba string"""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
     return f'rgba({r}, {g}, {b}, {alpha})'
 
 CATEGORY_COLORS = {
@@ -111,6 +125,14 @@ CATEGORY_COLORS = {
     "Creative": (COLORS['creative'], hex_to_rgba(COLORS['creative'])),
 }
 
+# Category badges: opening <span> per category, indexed by CATEGORY_CODE
+CATEGORY_KEYS = tuple(CATEGORY_COLORS)
+CATEGORY_CODE = {cat: i for i, cat in enumerate(CATEGORY_KEYS)}
+CATEGORY_HTML = tuple(
+    f'<span style="background:{color};color:#fff;padding:3px 10px;border-radius:10px;font-size:0.8rem">'
+    for color, _ in CATEGORY_COLORS.values()
+)
+
 # =============================================================================
 # TECHNICAL SKILLS (20 Skills)
 # Source: O*NET, BLS wage data, industry research
@@ -520,6 +542,15 @@ KEY_SKILLS = [
     "Leadership", "Emotional Intelligence", "Adaptability"
 ]
 
+# Assessment sections per mode: (header, {skill: info}) in display order
+_SKILL_SECTIONS = (("💻 Technical Skills", "Technical"), ("🧠 Cognitive Skills", "Cognitive"), ("🤝 Soft Skills", "Soft"))
+_SKILLS_BY_CATEGORY_FULL = tuple(
+    (header, {k: v for k, v in SKILLS_DATA.items() if v.get('category') == cat}) for header, cat in _SKILL_SECTIONS
+)
+_SKILLS_BY_CATEGORY_QUICK = tuple(
+    (header, {k: v for k, v in skills.items() if k in KEY_SKILLS}) for header, skills in _SKILLS_BY_CATEGORY_FULL
+)
+
 # =============================================================================
 # CAREER DATA (50 Careers across 8 Categories)
 # =============================================================================
@@ -841,9 +872,54 @@ CAREER_DATA = {
     },
 }
 
+# =============================================================================
+# CAREER x SKILL MATRIX
+# Required levels (0-100) stored as uint8; 0 = skill not rated for that career
+# =============================================================================
+SKILL_ORDER = tuple(SKILLS_DATA)
+SKILL_INDEX = {skill: j for j, skill in enumerate(SKILL_ORDER)}
+N_SKILLS = len(SKILL_ORDER)
+CAREER_NAMES = tuple(CAREER_DATA)
+CAREER_INDEX = {career: i for i, career in enumerate(CAREER_NAMES)}
+
+@st.cache_resource
+def _precompute_career_tables():
+    """Build the matrix and per-career scoring tables once per process; shared across reruns, so arrays are read-only."""
+    skill_mat = np.zeros((len(CAREER_NAMES), N_SKILLS), dtype=np.uint8)
+    for i, career in enumerate(CAREER_NAMES):
+        for skill, required in CAREER_DATA[career]["skills"].items():
+            skill_mat[i, SKILL_INDEX[skill]] = required
+    
+    # Scoring inputs that depend only on the catalogue
+    required = skill_mat.astype(np.float32)
+    weights = required / 100
+    weight_sum = weights.sum(axis=1)
+    rated = skill_mat > 0
+    rated_count = rated.sum(axis=1)
+    skill_keys = {career: tuple(CAREER_DATA[career]["skills"]) for career in CAREER_NAMES}
+    skill_cols = {career: np.array([SKILL_INDEX[s] for s in skills]) for career, skills in skill_keys.items()}
+    
+    # Per-career attributes as parallel arrays, row-aligned with the matrix
+    categories = np.array([CATEGORY_CODE[CAREER_DATA[c]["category"]] for c in CAREER_NAMES], dtype=np.int8)
+    salaries = np.array([CAREER_DATA[c]["median_salary"] for c in CAREER_NAMES], dtype=np.int32)
+    growths = np.array([CAREER_DATA[c]["growth_rate"] for c in CAREER_NAMES], dtype=np.int16)
+    
+    for arr in (skill_mat, required, weights, weight_sum, rated, rated_count, categories, salaries, growths, *skill_cols.values()):
+        arr.flags.writeable = False
+    return (skill_mat, required, weights, weight_sum, rated, rated_count,
+            skill_keys, skill_cols, categories, salaries, growths)
+
+(CAREER_SKILL_MAT, CAREER_REQUIRED, CAREER_WEIGHTS, CAREER_WEIGHT_SUM, CAREER_RATED, CAREER_RATED_COUNT,
+ CAREER_SKILL_KEYS, CAREER_SKILL_COLS, CAREER_CATEGORIES, CAREER_SALARIES, CAREER_GROWTHS) = _precompute_career_tables()
+
 # =============================================================================
 # SESSION STATE INITIALIZATION
 # =============================================================================
+@st.cache_data
+def default_user_skills():
+    """Baseline skill levels for a new session (every skill starts at 50)."""
+    return {skill: 50 for skill in SKILLS_DATA}
+
 if 'onboarding_step' not in st.session_state:
     st.session_state.onboarding_step = 0
 if 'onboarding_complete' not in st.session_state:
@@ -851,7 +927,7 @@ if 'onboarding_complete' not in st.session_state:
 if 'user_profile' not in st.session_state:
     st.session_state.user_profile = {}
 if 'user_skills' not in st.session_state:
-    st.session_state.user_skills = {skill: 50 for skill in SKILLS_DATA.keys()}
+    st.session_state.user_skills = default_user_skills()
 if 'target_careers' not in st.session_state:
     st.session_state.target_careers = []
 if 'chat_history' not in st.session_state:
@@ -869,20 +945,8 @@ st.markdown("""
     .main-header { font-size: 2.5rem; background: linear-gradient(135deg, #2E86AB, #A23B72); -webkit-background-clip: text; -webkit-text-fill-color: transparent; text-align: center; font-weight: bold; }
     .progress-container { background: #1a1a2e; border-radius: 10px; padding: 5px; margin: 1rem 0; }
     .progress-bar { background: linear-gradient(90deg, #2E86AB, #A23B72); border-radius: 8px; height: 10px; transition: width 0.3s ease; }
-    .step { flex: 1; text-align: center; padding: 10px; border-radius: 5px; margin: 0 5px; }
-    .step-active { background: #2E86AB; color: white; }
-    .step-complete { background: #2ecc71; color: white; }
-    .step-pending { background: #333; color: #888; }
     .info-card { background: linear-gradient(135deg, #1a1a2e, #16213e); border-radius: 15px; padding: 1.5rem; border: 1px solid #2E86AB; margin: 0.5rem 0; }
     .roi-positive { color: #2ecc71; font-weight: bold; }
-    .category-technology { background: #3498db; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-healthcare { background: #e74c3c; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-business { background: #2ecc71; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-education { background: #9b59b6; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-community { background: #f39c12; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-mental-health { background: #1abc9c; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-trades { background: #e67e22; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
-    .category-creative { background: #9b59b6; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.8rem; }
     .welcome-box { background: linear-gradient(135deg, #1e3a5f, #2E86AB); border-radius: 20px; padding: 2rem; text-align: center; margin: 2rem 0; }
     .skill-gap-high { color: #e74c3c; }
     .skill-gap-medium { color: #f39c12; }
@@ -891,19 +955,85 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Onboarding step cards with styles inlined, indexed by state: done / current / upcoming
+_STEP_CARD_STYLE = "flex: 1; text-align: center; padding: 10px; border-radius: 5px; margin: 0 5px;"
+STEP_CARD_TEMPLATES = (
+    f'<div style="{_STEP_CARD_STYLE} background: #2ecc71; color: white;">✓ {{name}}</div>',
+    f'<div style="{_STEP_CARD_STYLE} background: #2E86AB; color: white;">● {{name}}</div>',
+    f'<div style="{_STEP_CARD_STYLE} background: #333; color: #888;">○ {{name}}</div>',
+)
+
+# Dashboard target-career card; call with the fields below (badge comes from CATEGORY_HTML)
+render_career_card = (
+    '<div>{badge}{category}</span>'
+    '<p style="font-weight: bold; margin: 0.75rem 0 0.5rem 0;">{career}</p>'
+    '<p style="color: #888; font-size: 0.875rem; margin: 0;">Readiness</p>'
+    '<p style="font-size: 2rem; margin: 0;">{readiness:.0f}%</p>'
+    '<small style="color: {band_color};">{band}</small>'
+    '<p style="color: #888; font-size: 0.875rem; margin: 0.5rem 0 0 0;">Salary</p>'
+    '<p style="font-size: 2rem; margin: 0;">${salary:,}</p>'
+    '<p style="color: #888; font-size: 0.875rem;">🔴 {high_gaps} high-priority gaps</p></div>'
+).format
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
-def calculate_skill_gaps(user_skills, target_career):
+def user_skill_bytes(user_skills) -> bytes:
+    """Pack user skill levels (0-100) into one byte per skill, in SKILL_ORDER."""
+    return bytes(user_skills.get(skill, 0) for skill in SKILL_ORDER)
+
+def practice_freq_bytes(practice_freq) -> bytes:
+    """Pack practice-frequency answers as FREQ_CODE values, one byte per skill in SKILL_ORDER."""
+    return bytes(FREQ_CODE.get(practice_freq.get(skill, "Sometimes"), 1) for skill in SKILL_ORDER)
+
+def practice_weight_vec(freq_bytes) -> np.ndarray:
+    """Practice-frequency weights as a float32 vector aligned with SKILL_ORDER."""
+    return FREQ_WEIGHT[np.frombuffer(freq_bytes, dtype=np.int8)]
+
+def _ratio_matrix(required, user_vec, freq_weights):
+    """min(effective/required, 1) per (career, skill); skills a career doesn't rate get 1."""
+    effective = np.minimum(100, user_vec.astype(np.float32) * freq_weights)
+    ratio = np.divide(effective, required, out=np.ones_like(required), where=required > 0)
+    np.minimum(ratio, 1.0, out=ratio)
+    return ratio
+
+UserScores = namedtuple("UserScores", ["match_pct", "readiness", "high_gaps", "band"])
+
+@st.cache_data(max_entries=512)
+def compute_user_session_state(skill_bytes, freq_bytes):
+    """Score every career once for the user's inputs; arrays are row-aligned with CAREER_NAMES.
+
+    match_pct weights each skill ratio by its required level, readiness is the
+    plain mean over the career's rated skills, and high_gaps counts skills
+    more than 30 points short. band holds readiness band codes.
+    """
+    user_vec = np.frombuffer(skill_bytes, dtype=np.uint8)
+    ratio = _ratio_matrix(CAREER_REQUIRED, user_vec, practice_weight_vec(freq_bytes))
+    match_pct = (ratio * CAREER_WEIGHTS).sum(axis=1) / CAREER_WEIGHT_SUM * 100
+    readiness = (ratio * CAREER_RATED).sum(axis=1) / CAREER_RATED_COUNT * 100
+    high_gaps = (CAREER_SKILL_MAT > user_vec + 30).sum(axis=1)  # uint8 compare; user levels are <= 100
+    return UserScores(match_pct, readiness, high_gaps, get_readiness_bands_vec(readiness))
+
+# Gap priority codes index these; icons are only materialized for display
+PRIORITY_ICONS = np.array(["🟢", "🟡", "🔴"])
+
+@st.cache_data(max_entries=512)
+def calculate_skill_gaps(skill_bytes, target_career):
+    """Return (skills, user_level, required_level, gap, priority) for a career.
+
+    The arrays are parallel to ``skills`` (the career's own skill order);
+    priority is 0 = Low, 1 = Medium, 2 = High.
+    """
     if target_career not in CAREER_DATA:
-        return {}
-    career_skills = CAREER_DATA[target_career]["skills"]
-    gaps = {}
-    for skill, required_level in career_skills.items():
-        user_level = user_skills.get(skill, 0)
-        gap = required_level - user_level
-        gaps[skill] = {"user_level": user_level, "required_level": required_level, "gap": max(0, gap), "priority": "High" if gap > 30 else "Medium" if gap > 15 else "Low"}
-    return gaps
+        empty = np.zeros(0, dtype=np.int16)
+        return (), empty, empty, empty, empty.astype(np.int8)
+    skills = CAREER_SKILL_KEYS[target_career]
+    cols = CAREER_SKILL_COLS[target_career]
+    user_level = np.frombuffer(skill_bytes, dtype=np.uint8)[cols].astype(np.int16)
+    required_level = CAREER_SKILL_MAT[CAREER_INDEX[target_career], cols].astype(np.int16)
+    gap = np.maximum(required_level - user_level, 0)
+    priority = (gap > 15).astype(np.int8) + (gap > 30)
+    return skills, user_level, required_level, gap, priority
 
 def calculate_skill_roi(skill_name, current_level, target_level):
     if skill_name not in SKILLS_DATA:
@@ -913,55 +1043,48 @@ def calculate_skill_roi(skill_name, current_level, target_level):
     salary_increase = (improvement / 100) * skill_info["salary_premium"]
     return {"skill": skill_name, "current_level": current_level, "target_level": target_level, "improvement_needed": improvement, "potential_salary_increase": salary_increase, "demand_trend": skill_info["demand_trend"], "courses": skill_info["courses"]}
 
-def get_career_matches(user_skills, target_industries):
+@st.cache_data(max_entries=512)
+def get_career_matches(skill_bytes, freq_bytes, target_industries, top_k=None):
+    match_pct, _, high_gaps, _ = compute_user_session_state(skill_bytes, freq_bytes)
+    wanted = [CATEGORY_CODE[c] for c in target_industries if c in CATEGORY_CODE]
+    rows = np.flatnonzero(np.isin(CAREER_CATEGORIES, wanted))
+    if top_k is None:
+        rows = rows[np.argsort(-match_pct[rows], kind="stable")]
+    else:
+        rows = heapq.nlargest(top_k, rows, key=match_pct.__getitem__)
     matches = []
-    practice_freq = st.session_state.get('practice_freq', {})
-    for career, data in CAREER_DATA.items():
-        if data["category"] in target_industries:
-            total_match = 0
-            total_weight = 0
-            for skill, required in data["skills"].items():
-                user_level = user_skills.get(skill, 0)
-                freq = practice_freq.get(skill, "Sometimes")
-                effective_level = calculate_effective_level(user_level, freq)
-                weight = required / 100
-                match = min(effective_level / required, 1.0) if required > 0 else 1.0
-                total_match += match * weight
-                total_weight += weight
-            match_pct = (total_match / total_weight * 100) if total_weight > 0 else 0
-            gaps = calculate_skill_gaps(user_skills, career)
-            high_gaps = sum(1 for g in gaps.values() if g["priority"] == "High")
-            matches.append({"career": career, "category": data["category"], "match_pct": match_pct, "salary": data["median_salary"], "growth": data["growth_rate"], "high_skill_gaps": high_gaps, "education": data["education"], "time_to_entry": data["time_to_entry"]})
-    matches.sort(key=lambda x: x["match_pct"], reverse=True)
+    for i in rows:
+        data = CAREER_DATA[CAREER_NAMES[i]]
+        matches.append({"career": CAREER_NAMES[i], "category": data["category"], "match_pct": float(match_pct[i]), "salary": int(CAREER_SALARIES[i]), "growth": int(CAREER_GROWTHS[i]), "high_skill_gaps": int(high_gaps[i]), "education": data["education"], "time_to_entry": data["time_to_entry"]})
     return matches
 
-def hex_to_rgba(hex_color, alpha=0.3):
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return f'rgba({r}, {g}, {b}, {alpha})'
-
-def create_skill_radar(careers_to_compare, user_skills=None, title="Skill Comparison"):
-    fig = go.Figure()
+def _radar_skill_axes(careers):
+    """Radar axes for a tuple of careers: up to 10 of their skills (sorted), the closed theta, and matrix columns."""
     all_skills = set()
-    for career in careers_to_compare:
+    for career in careers:
         if career in CAREER_DATA:
             all_skills.update(CAREER_DATA[career]["skills"].keys())
-    skills = sorted(list(all_skills))[:10]
+    skills = tuple(sorted(all_skills)[:10])
+    skill_idx = np.array([SKILL_INDEX[skill] for skill in skills])
+    return skills, skills + skills[:1], skill_idx
+
+# Figures are shared between sessions and reruns; callers must not mutate them
+@st.cache_resource(max_entries=32)
+def create_skill_radar(careers_to_compare, skill_bytes=None, title="Skill Comparison"):
+    fig = go.Figure()
+    skills, skills_closed, skill_idx = _radar_skill_axes(careers_to_compare)
+    theta = list(skills_closed)
     colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#2ecc71']
-    if user_skills:
-        values = [user_skills.get(skill, 0) for skill in skills]
+    if skill_bytes:
+        values = np.frombuffer(skill_bytes, dtype=np.uint8)[skill_idx].tolist()
         values.append(values[0])
-        skills_closed = skills + [skills[0]]
-        fig.add_trace(go.Scatterpolar(r=values, theta=skills_closed, fill='toself', fillcolor='rgba(46, 204, 113, 0.2)', name="Your Skills", line=dict(color='#2ecc71', width=3, dash='dash')))
+        fig.add_trace(go.Scatterpolar(r=values, theta=theta, fill='toself', fillcolor='rgba(46, 204, 113, 0.2)', name="Your Skills", line=dict(color='#2ecc71', width=3, dash='dash')))
     for i, career in enumerate(careers_to_compare[:4]):
         if career in CAREER_DATA:
-            values = [CAREER_DATA[career]["skills"].get(skill, 0) for skill in skills]
+            values = CAREER_SKILL_MAT[CAREER_INDEX[career], skill_idx].tolist()
             values.append(values[0])
-            skills_closed = skills + [skills[0]]
             color = colors[i % len(colors)]
-            fig.add_trace(go.Scatterpolar(r=values, theta=skills_closed, fill='toself', fillcolor=hex_to_rgba(color, 0.2), name=career, line=dict(color=color, width=2)))
+            fig.add_trace(go.Scatterpolar(r=values, theta=theta, fill='toself', fillcolor=hex_to_rgba(color, 0.2), name=career, line=dict(color=color, width=2)))
     fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(color='white')), angularaxis=dict(tickfont=dict(color='white', size=9)), bgcolor='rgba(0,0,0,0)'), showlegend=True, legend=dict(font=dict(color='white'), bgcolor='rgba(0,0,0,0.5)'), title=dict(text=title, font=dict(color='white', size=16)), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', height=500)
     return fig
 
@@ -977,15 +1100,8 @@ if not st.session_state.onboarding_complete:
     progress_pct = (current_step / (len(steps) - 1)) * 100 if current_step > 0 else 0
     st.markdown(f'<div class="progress-container"><div class="progress-bar" style="width: {progress_pct}%"></div></div>', unsafe_allow_html=True)
     
-    cols = st.columns(len(steps))
-    for i, (col, step) in enumerate(zip(cols, steps)):
-        with col:
-            if i < current_step:
-                st.markdown(f'<div class="step step-complete">✓ {step}</div>', unsafe_allow_html=True)
-            elif i == current_step:
-                st.markdown(f'<div class="step step-active">● {step}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="step step-pending">○ {step}</div>', unsafe_allow_html=True)
+    step_cards = "".join(STEP_CARD_TEMPLATES[0 if i < current_step else 1 if i == current_step else 2].format(name=step) for i, step in enumerate(steps))
+    st.markdown(f'<div style="display: flex;">{step_cards}</div>', unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -1028,7 +1144,7 @@ if not st.session_state.onboarding_complete:
     
     elif st.session_state.onboarding_step == 2:
         st.markdown("### 🎯 Step 2: Where Do You Want To Go?")
-        target_industries = st.multiselect("Which industries interest you?", list(CATEGORY_COLORS.keys()), default=["Technology"])
+        target_industries = st.multiselect("Which industries interest you?", CATEGORY_KEYS, default=["Technology"])
         available_careers = [career for career, data in CAREER_DATA.items() if data["category"] in target_industries]
         if available_careers:
             target_careers = st.multiselect("Which specific careers interest you? (Select up to 3)", available_careers, max_selections=3)
@@ -1059,40 +1175,43 @@ if not st.session_state.onboarding_complete:
         
         if quick_mode:
             st.info(f"⚡ Quick Mode: Rating {len(KEY_SKILLS)} key skills. Others default to 50.")
-            skills_to_show = {k: v for k, v in SKILLS_DATA.items() if k in KEY_SKILLS}
-        else:
-            skills_to_show = SKILLS_DATA
-        
-        technical = {k: v for k, v in skills_to_show.items() if v.get('category') == 'Technical'}
-        cognitive = {k: v for k, v in skills_to_show.items() if v.get('category') == 'Cognitive'}
-        soft = {k: v for k, v in skills_to_show.items() if v.get('category') == 'Soft'}
         
-        for cat_name, cat_skills in [("💻 Technical Skills", technical), ("🧠 Cognitive Skills", cognitive), ("🤝 Soft Skills", soft)]:
+        user_skills = st.session_state.user_skills
+        practice_freq = st.session_state.practice_freq
+        for cat_name, cat_skills in _SKILLS_BY_CATEGORY_QUICK if quick_mode else _SKILLS_BY_CATEGORY_FULL:
             if cat_skills:
                 st.markdown(f'<div class="skill-category-header">{cat_name}</div>', unsafe_allow_html=True)
-                for skill, info in cat_skills.items():
-                    col1, col2 = st.columns([2, 1])
-                    with col1:
-                        st.session_state.user_skills[skill] = st.slider(skill, 0, 100, st.session_state.user_skills.get(skill, 50), help=info["description"], key=f"skill_{skill}")
-                    with col2:
-                        freq_opts = ["Often (weekly+)", "Sometimes", "Rarely/Never"]
-                        curr = st.session_state.practice_freq.get(skill, "Sometimes")
-                        idx = freq_opts.index(curr) if curr in freq_opts else 1
-                        st.session_state.practice_freq[skill] = st.selectbox("Practice", freq_opts, index=idx, key=f"freq_{skill}", label_visibility="collapsed")
-                    base = st.session_state.user_skills[skill]
-                    freq = st.session_state.practice_freq[skill]
+                names = list(cat_skills)
+                edited = st.data_editor(
+                    pd.DataFrame({
+                        "Skill": names,
+                        "Level": [user_skills.get(skill, 50) for skill in names],
+                        "Practice": [freq if (freq := practice_freq.get(skill)) in FREQ_OPTIONS else "Sometimes" for skill in names],
+                        "About": [info["description"] for info in cat_skills.values()],
+                    }),
+                    column_config={
+                        "Level": st.column_config.NumberColumn(min_value=0, max_value=100, step=1, required=True),
+                        "Practice": st.column_config.SelectboxColumn(options=FREQ_OPTIONS, required=True),
+                    },
+                    disabled=["Skill", "About"],
+                    hide_index=True,
+                    key=f"skills_{cat_name}",
+                )
+                levels = edited["Level"].astype(int).tolist()
+                freqs = edited["Practice"].tolist()
+                user_skills.update(zip(names, levels))
+                practice_freq.update(zip(names, freqs))
+                for skill, base, freq in zip(names, levels, freqs):
                     weight = practice_weight(freq)
                     if weight != 1.0:
                         effective = calculate_effective_level(base, freq)
-                        st.caption(f"Effective: {base} × {weight} = **{effective:.0f}** {'↑' if weight > 1 else '↓'}")
+                        st.caption(f"{skill} effective: {base} × {weight} = **{effective:.0f}** {'↑' if weight > 1 else '↓'}")
         
         if quick_mode:
             for skill in SKILLS_DATA:
                 if skill not in KEY_SKILLS:
-                    if skill not in st.session_state.user_skills:
-                        st.session_state.user_skills[skill] = 50
-                    if skill not in st.session_state.practice_freq:
-                        st.session_state.practice_freq[skill] = "Sometimes"
+                    user_skills.setdefault(skill, 50)
+                    practice_freq.setdefault(skill, "Sometimes")
         
         col1, col2 = st.columns(2)
         with col1:
@@ -1121,6 +1240,12 @@ if not st.session_state.onboarding_complete:
                 st.rerun()
 
 else:
+    # Hashable fingerprint of the user's inputs; cached helpers key on these
+    user_skills = st.session_state.user_skills
+    skill_bytes = user_skill_bytes(user_skills)
+    freq_bytes = practice_freq_bytes(st.session_state.practice_freq)
+    scores = compute_user_session_state(skill_bytes, freq_bytes)
+
     with st.sidebar:
         st.markdown("### 👤 Your Profile")
         st.markdown(f"**Role:** {st.session_state.user_profile.get('current_role', 'Not set')}")
@@ -1133,20 +1258,8 @@ else:
         st.markdown("### 📊 Quick Stats")
         target_careers = st.session_state.target_careers
         if target_careers:
-            practice_freq = st.session_state.get('practice_freq', {})
-            readiness_scores = []
-            for c in target_careers:
-                if c in CAREER_DATA:
-                    career_skills = CAREER_DATA[c]["skills"]
-                    total_match = 0
-                    for skill, required in career_skills.items():
-                        user_level = st.session_state.user_skills.get(skill, 0)
-                        freq = practice_freq.get(skill, "Sometimes")
-                        effective_level = calculate_effective_level(user_level, freq)
-                        match = min(effective_level / required, 1.0) if required > 0 else 1.0
-                        total_match += match
-                    readiness_scores.append((total_match / len(career_skills)) * 100)
-            avg_readiness = np.mean(readiness_scores) if readiness_scores else 0
+            rows = [CAREER_INDEX[c] for c in target_careers if c in CAREER_INDEX]
+            avg_readiness = scores.readiness[rows].mean() if rows else 0
             band_name, band_label, band_color = get_readiness_band(avg_readiness)
             st.metric("Career Readiness", f"{avg_readiness:.0f}%")
             st.markdown(f"<span style='color: {band_color}; font-weight: bold;'>{band_name.upper()}</span>", unsafe_allow_html=True)
@@ -1161,36 +1274,23 @@ else:
     with tab1:
         st.markdown("## 📊 Your Career Dashboard")
         target_careers = st.session_state.target_careers
-        user_skills = st.session_state.user_skills
         if target_careers:
             st.markdown("### 🎯 Your Target Careers")
             cols = st.columns(len(target_careers))
-            practice_freq = st.session_state.get('practice_freq', {})
             for i, career in enumerate(target_careers):
                 if career in CAREER_DATA:
                     data = CAREER_DATA[career]
-                    gaps = calculate_skill_gaps(user_skills, career)
-                    total_match = 0
-                    for skill, gap_info in gaps.items():
-                        freq = practice_freq.get(skill, "Sometimes")
-                        effective = calculate_effective_level(gap_info['user_level'], freq)
-                        required = gap_info['required_level']
-                        match = min(effective / required, 1.0) if required > 0 else 1.0
-                        total_match += match
-                    readiness = (total_match / len(gaps) * 100) if gaps else 0
-                    band_name, band_label, band_color = get_readiness_band(readiness)
-                    high_gaps = sum(1 for g in gaps.values() if g['priority'] == 'High')
+                    row = CAREER_INDEX[career]
+                    readiness, high_gaps, band = scores.readiness[row], scores.high_gaps[row], scores.band[row]
                     with cols[i]:
-                        cat_class = f"category-{data['category'].lower().replace(' ', '-')}"
-                        st.markdown(f'<span class="{cat_class}">{data["category"]}</span>', unsafe_allow_html=True)
-                        st.markdown(f"**{career}**")
-                        st.metric("Readiness", f"{readiness:.0f}%")
-                        st.markdown(f"<small style='color: {band_color};'>{band_name.title()}</small>", unsafe_allow_html=True)
-                        st.metric("Salary", f"${data['median_salary']:,}")
-                        st.caption(f"🔴 {high_gaps} high-priority gaps")
+                        st.markdown(render_career_card(
+                            badge=CATEGORY_HTML[CAREER_CATEGORIES[row]], category=data["category"], career=career,
+                            readiness=readiness, band_color=BAND_COLORS[band], band=BAND_NAMES[band].title(),
+                            salary=data["median_salary"], high_gaps=high_gaps,
+                        ), unsafe_allow_html=True)
             st.markdown("---")
             st.markdown("### 📈 Skills Comparison")
-            fig = create_skill_radar(target_careers, user_skills, "Your Skills vs Career Requirements")
+            fig = create_skill_radar(tuple(target_careers), skill_bytes, "Your Skills vs Career Requirements")
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Select target careers in your assessment to see your dashboard.")
@@ -1200,17 +1300,17 @@ else:
         if target_careers:
             selected_career = st.selectbox("Select career to analyze:", target_careers)
             if selected_career:
-                gaps = calculate_skill_gaps(user_skills, selected_career)
-                sorted_gaps = sorted(gaps.items(), key=lambda x: x[1]['gap'], reverse=True)
+                skills, user_level, required_level, gap, priority = calculate_skill_gaps(skill_bytes, selected_career)
+                icons = PRIORITY_ICONS[priority]
                 st.markdown("### Priority Skills to Develop")
-                for skill, gap_info in sorted_gaps:
-                    if gap_info['gap'] > 0:
-                        priority_color = {"High": "🔴", "Medium": "🟡", "Low": "🟢"}[gap_info['priority']]
-                        with st.expander(f"{priority_color} {skill} (Gap: {gap_info['gap']} points)"):
+                for j in np.argsort(-gap, kind="stable"):
+                    if gap[j] > 0:
+                        skill = skills[j]
+                        with st.expander(f"{icons[j]} {skill} (Gap: {gap[j]} points)"):
                             col1, col2 = st.columns(2)
                             with col1:
-                                st.markdown(f"**Your Level:** {gap_info['user_level']}")
-                                st.markdown(f"**Required:** {gap_info['required_level']}")
+                                st.markdown(f"**Your Level:** {user_level[j]}")
+                                st.markdown(f"**Required:** {required_level[j]}")
                             with col2:
                                 if skill in SKILLS_DATA:
                                     premium = SKILLS_DATA[skill]['salary_premium']
@@ -1223,10 +1323,10 @@ else:
         st.markdown("## 📚 Recommended Courses")
         if target_careers:
             career = st.selectbox("Courses for:", target_careers, key="course_career")
-            gaps = calculate_skill_gaps(user_skills, career)
-            sorted_gaps = sorted(gaps.items(), key=lambda x: x[1]['gap'], reverse=True)[:5]
-            for skill, gap_info in sorted_gaps:
-                if skill in SKILLS_DATA and gap_info['gap'] > 10:
+            skills, _, _, gap, _ = calculate_skill_gaps(skill_bytes, career)
+            for j in heapq.nlargest(5, range(len(skills)), key=gap.__getitem__):
+                skill = skills[j]
+                if skill in SKILLS_DATA and gap[j] > 10:
                     st.markdown(f"### {skill}")
                     courses = SKILLS_DATA[skill]['courses']
                     for course in courses:
@@ -1237,9 +1337,9 @@ else:
     
     with tab4:
         st.markdown("## 🔍 Career Explorer")
-        industries = st.multiselect("Filter by industry:", list(CATEGORY_COLORS.keys()), default=list(CATEGORY_COLORS.keys()))
-        matches = get_career_matches(user_skills, industries)
-        for match in matches[:10]:
+        industries = st.multiselect("Filter by industry:", CATEGORY_KEYS, default=CATEGORY_KEYS)
+        matches = get_career_matches(skill_bytes, freq_bytes, tuple(industries), top_k=10)
+        for match in matches:
             with st.expander(f"**{match['career']}** | {match['match_pct']:.0f}% Match | ${match['salary']:,}"):
                 col1, col2, col3 = st.columns(3)
                 with col1:
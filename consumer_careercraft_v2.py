@@ -17,7 +17,17 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import re
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from string import Template
+from types import MappingProxyType
+
+try:
+    from numba import njit
+except ImportError:  # optional; _match_kernel falls back to NumPy
+    njit = None
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -47,12 +57,13 @@ COLORS = {
 
 def hex_to_rgba(hex_color, alpha=0.3):
     """Convert hex color to rgba string"""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
     return f'rgba({r}, {g}, {b}, {alpha})'
 
+def _fmt_salary(amount):
+    """Dollar amount with thousands separators, e.g. $110,000"""
+    return f"${amount:,}"
+
 CATEGORY_COLORS = {
     "Technology": (COLORS['tech'], hex_to_rgba(COLORS['tech'])),
     "Healthcare": (COLORS['healthcare'], hex_to_rgba(COLORS['healthcare'])),
@@ -141,6 +152,10 @@ SKILLS_DATA = {
     },
 }
 
+# Best-ROI course first everywhere courses are listed or a "top course" is picked
+for _skill_info in SKILLS_DATA.values():
+    _skill_info["courses"].sort(key=lambda c: c["roi"], reverse=True)
+
 CAREER_DATA = {
     # TECHNOLOGY CAREERS
     "Software Developer": {
@@ -463,9 +478,136 @@ CAREER_DATA = {
     },
 }
 
+# =============================================================================
+# CAREER x SKILL MATRIX
+# Required levels as one (careers x skills) array, rows aligned with CAREER_NAMES
+# =============================================================================
+@st.cache_resource
+def _precompute_career_tables():
+    """Build the matrix tables once per process; shared across reruns, so arrays are read-only"""
+    skill_keys = tuple(SKILLS_DATA)
+    career_names = tuple(CAREER_DATA)
+    
+    req = np.fromiter(
+        (CAREER_DATA[career]["skills"].get(skill, 0) for career in career_names for skill in skill_keys),
+        dtype=np.float32, count=len(career_names) * len(skill_keys)
+    ).reshape(len(career_names), len(skill_keys))
+    salary = np.array([CAREER_DATA[career]["median_salary"] for career in career_names])
+    growth = np.array([CAREER_DATA[career]["growth_rate"] for career in career_names])
+    for arr in (req, salary, growth):
+        arr.flags.writeable = False
+    
+    # Row indices per category, in CAREER_DATA order
+    category_rows = {}
+    for row, career in enumerate(career_names):
+        category_rows.setdefault(CAREER_DATA[career]["category"], []).append(row)
+    category_rows = {cat: tuple(rows) for cat, rows in category_rows.items()}
+    
+    career_row = {career: row for row, career in enumerate(career_names)}
+    
+    return skill_keys, career_names, req, salary, growth, category_rows, career_row
+
+SKILL_KEYS, CAREER_NAMES, REQ, SALARY, GROWTH, CATEGORY_ROWS, CAREER_ROW = _precompute_career_tables()
+
+@st.cache_resource
+def _careers_by_category():
+    """Career names per category, in CAREER_DATA order; the named view of CATEGORY_ROWS"""
+    return {cat: tuple(CAREER_NAMES[row] for row in rows) for cat, rows in CATEGORY_ROWS.items()}
+
+@st.cache_resource
+def _career_soa():
+    """Remaining per-career columns as arrays aligned with CAREER_NAMES: time to entry, category id, category names"""
+    categories = tuple(CATEGORY_ROWS)
+    category_ids = np.empty(len(CAREER_NAMES), dtype=np.intp)
+    for cat_id, cat in enumerate(categories):
+        category_ids[list(CATEGORY_ROWS[cat])] = cat_id
+    time_to_entry = np.array([CAREER_DATA[career]["time_to_entry"] for career in CAREER_NAMES])
+    for arr in (time_to_entry, category_ids):
+        arr.flags.writeable = False
+    return time_to_entry, category_ids, categories
+
+TIME_TO_ENTRY, CATEGORY_IDS, CATEGORIES = _career_soa()
+CATEGORY_ID = {cat: cat_id for cat_id, cat in enumerate(CATEGORIES)}
+# CSS class for each category badge, as named in the custom CSS below
+_CAT_CLASS = {
+    "Technology": "category-tech",
+    "Healthcare": "category-healthcare",
+    "Business": "category-business",
+    "Education": "category-education",
+    "Community": "category-community",
+    "Mental Health": "category-mental-health",
+}
+
+# Per-career sum of required levels: the match score denominator
+REQ_TOTAL = REQ.sum(axis=1)
+REQ_TOTAL.flags.writeable = False
+
+@dataclass(slots=True, frozen=True)
+class CareerInfo:
+    """One career's record; REQ[CAREER_ROW[career]] holds its required skill levels"""
+    category: str
+    median_salary: int
+    growth_rate: int
+    education: str
+    entry_paths: tuple
+    time_to_entry: str
+
+# REQ is the source of truth for skills from here on; the authored dicts become frozen records
+CAREER_DATA = {
+    career: CareerInfo(
+        category=info["category"],
+        median_salary=info["median_salary"],
+        growth_rate=info["growth_rate"],
+        education=info["education"],
+        entry_paths=tuple(info["entry_paths"]),
+        time_to_entry=info["time_to_entry"],
+    )
+    for career, info in CAREER_DATA.items()
+}
+
+# Gap priority: np.digitize(gap, GAP_PRIORITY_EDGES, right=True) indexes PRIORITY_LABELS
+_HIGH_GAP_THRESHOLD = 30
+GAP_PRIORITY_EDGES = (15, _HIGH_GAP_THRESHOLD)
+PRIORITY_LABELS = np.array(["Low", "Medium", "High"])
+
+# Radar chart: closed polygon axes, palette, and closed requirement values per career
+SKILL_KEYS_CLOSED = SKILL_KEYS + (SKILL_KEYS[0],)
+RADAR_COLORS = ('#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#2ecc71')
+# RADAR_COLORS at 0.2 alpha, written out so no colour is parsed at runtime
+PALETTE_RGBA = (
+    'rgba(46, 134, 171, 0.2)',
+    'rgba(162, 59, 114, 0.2)',
+    'rgba(241, 143, 1, 0.2)',
+    'rgba(199, 62, 29, 0.2)',
+    'rgba(46, 204, 113, 0.2)',
+)
+# "Your Skills" trace, fixed so reordering the palette never recolours it
+USER_TRACE_COLOR = '#2ecc71'
+USER_TRACE_FILL = 'rgba(46, 204, 113, 0.2)'
+
+def _close(arr):
+    """arr with its first value repeated at the end, closing a radar polygon"""
+    return np.append(arr, arr[0])
+
+@st.cache_resource
+def _career_radar_values():
+    """Requirement values per career with the first value repeated to close the polygon"""
+    return {
+        career: tuple(_close(REQ[row]).astype(int).tolist())
+        for row, career in enumerate(CAREER_NAMES)
+    }
+
+CAREER_RADAR_VALUES = _career_radar_values()
+
 # =============================================================================
 # SESSION STATE INITIALIZATION
 # =============================================================================
+CHAT_HISTORY_MAXLEN = 50  # Oldest messages drop off once the chat grows past this
+
+# Every skill starts at 50; each session gets its own copy
+_DEFAULT_USER_SKILLS = MappingProxyType({skill: 50 for skill in SKILLS_DATA})
+
+# Guarded rather than setdefault(), which would build every default container on each rerun
 if 'onboarding_step' not in st.session_state:
     st.session_state.onboarding_step = 0
 if 'onboarding_complete' not in st.session_state:
@@ -473,17 +615,16 @@ if 'onboarding_complete' not in st.session_state:
 if 'user_profile' not in st.session_state:
     st.session_state.user_profile = {}
 if 'user_skills' not in st.session_state:
-    st.session_state.user_skills = {skill: 50 for skill in SKILLS_DATA.keys()}
+    st.session_state.user_skills = dict(_DEFAULT_USER_SKILLS)
 if 'target_careers' not in st.session_state:
     st.session_state.target_careers = []
 if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
+    st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_MAXLEN)
 
 # =============================================================================
 # CUSTOM CSS
 # =============================================================================
-st.markdown("""
-<style>
+_CSS = """
     /* Main styling */
     .main-header {
         font-size: 2.5rem;
@@ -559,43 +700,88 @@ st.markdown("""
     .skill-gap-high { color: #e74c3c; }
     .skill-gap-medium { color: #f39c12; }
     .skill-gap-low { color: #2ecc71; }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _load_css():
+    """Stylesheet as one compact <style> tag (comments and indentation stripped), built once"""
+    css = re.sub(r"/\*.*?\*/", "", _CSS, flags=re.DOTALL)
+    return "<style>" + re.sub(r"\s+", " ", css).strip() + "</style>"
+
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+@st.cache_resource
+def _priority_order():
+    """Sort rank per gap priority, High first"""
+    return {'High': 0, 'Medium': 1, 'Low': 2}
+
+@st.cache_resource
+def _skill_help_map():
+    """Skill description per skill, used as slider help text"""
+    return {skill: info["description"] for skill, info in SKILLS_DATA.items()}
+
+def _user_vector(user_skills):
+    """User skill levels as a float32 vector aligned with SKILL_KEYS"""
+    return np.fromiter((user_skills.get(skill, 0) for skill in SKILL_KEYS), dtype=np.float32, count=len(SKILL_KEYS))
+
 def calculate_skill_gaps(user_skills, target_career):
     """Calculate skill gaps between user and target career"""
     if target_career not in CAREER_DATA:
         return {}
     
-    career_skills = CAREER_DATA[target_career]["skills"]
-    gaps = {}
+    # Whole row at once; the dict below only reads the results back out
+    req_row = REQ[CAREER_ROW[target_career]]
+    gap_row = np.maximum(req_row - _user_vector(user_skills), 0).astype(int)
+    priority_row = PRIORITY_LABELS[np.digitize(gap_row, GAP_PRIORITY_EDGES, right=True)]
+    required_row = req_row.astype(int).tolist()
     
-    for skill, required_level in career_skills.items():
-        user_level = user_skills.get(skill, 0)
-        gap = required_level - user_level
+    gaps = {}
+    for col, skill in enumerate(SKILL_KEYS):
         gaps[skill] = {
-            "user_level": user_level,
-            "required_level": required_level,
-            "gap": max(0, gap),
-            "priority": "High" if gap > 30 else "Medium" if gap > 15 else "Low"
+            "user_level": user_skills.get(skill, 0),
+            "required_level": required_row[col],
+            "gap": int(gap_row[col]),
+            "priority": str(priority_row[col])
         }
     
     return gaps
 
+@st.cache_data
+def _skill_roi_info(skill_name):
+    """(salary_premium, demand_trend, courses sorted by ROI) for a skill"""
+    skill_info = SKILLS_DATA[skill_name]
+    return skill_info["salary_premium"], skill_info["demand_trend"], skill_info["courses"]
+
+@st.cache_data
+def _skill_roi_md(skill_name):
+    """Consultation bullets for a skill: salary premium, demand and its best-ROI course"""
+    skill_info = SKILLS_DATA[skill_name]
+    return (
+        f"- 💰 Salary Premium: +{_fmt_salary(skill_info['salary_premium'])}/year at high proficiency\n"
+        f"- 📈 Demand: {skill_info['demand_trend']}\n"
+        f"- ⏱️ Top Course: {skill_info['courses'][0]['name']}"
+    )
+
+@st.cache_data(ttl=3600, max_entries=256)
+def _cached_gaps(career, skills_key):
+    """calculate_skill_gaps memoized on a hashable skills_key: sorted (skill, level) pairs"""
+    return calculate_skill_gaps(dict(skills_key), career)
+
+@st.cache_data(ttl=3600, max_entries=256)
 def calculate_skill_roi(skill_name, current_level, target_level):
     """Calculate ROI for improving a specific skill"""
     if skill_name not in SKILLS_DATA:
         return None
     
-    skill_info = SKILLS_DATA[skill_name]
+    salary_premium, demand_trend, courses = _skill_roi_info(skill_name)
     improvement = target_level - current_level
     
     # Calculate potential salary increase (proportional to improvement)
-    salary_increase = (improvement / 100) * skill_info["salary_premium"]
+    salary_increase = (improvement / 100) * salary_premium
     
     return {
         "skill": skill_name,
@@ -603,220 +789,358 @@ def calculate_skill_roi(skill_name, current_level, target_level):
         "target_level": target_level,
         "improvement_needed": improvement,
         "potential_salary_increase": salary_increase,
-        "demand_trend": skill_info["demand_trend"],
-        "courses": skill_info["courses"]
+        "demand_trend": demand_trend,
+        "courses": courses
     }
 
-def get_career_matches(user_skills, target_industries):
-    """Get careers that match user skills and target industries"""
-    matches = []
+def _match_kernel_np(user_vec, req, high_threshold):
+    """Per-career sum(min(user, required)) and count of gaps above high_threshold"""
+    return np.minimum(req, user_vec).sum(axis=1), (req - user_vec > high_threshold).sum(axis=1)
+
+@st.cache_resource
+def _match_kernel():
+    """Match kernel, built once per process: numba-compiled loops when numba is installed, else NumPy"""
+    if njit is None:
+        return _match_kernel_np
     
-    for career, data in CAREER_DATA.items():
-        if data["category"] in target_industries:
-            # Calculate match score
-            total_match = 0
-            total_weight = 0
-            
-            for skill, required in data["skills"].items():
-                user_level = user_skills.get(skill, 0)
-                weight = required / 100
-                match = min(user_level / required, 1.0) if required > 0 else 1.0
-                total_match += match * weight
-                total_weight += weight
-            
-            match_pct = (total_match / total_weight * 100) if total_weight > 0 else 0
-            
-            # Calculate skill gap count
-            gaps = calculate_skill_gaps(user_skills, career)
-            high_gaps = sum(1 for g in gaps.values() if g["priority"] == "High")
-            
-            matches.append({
-                "career": career,
-                "category": data["category"],
-                "match_pct": match_pct,
-                "salary": data["median_salary"],
-                "growth": data["growth_rate"],
-                "high_skill_gaps": high_gaps,
-                "education": data["education"],
-                "time_to_entry": data["time_to_entry"]
-            })
+    @njit(cache=True)
+    def kernel(user_vec, req, high_threshold):
+        n_careers, n_skills = req.shape
+        min_sum = np.zeros(n_careers, np.float32)
+        high_gaps = np.zeros(n_careers, np.int64)
+        for i in range(n_careers):
+            for j in range(n_skills):
+                required = req[i, j]
+                user = user_vec[j]
+                min_sum[i] += min(required, user)
+                if required - user > high_threshold:
+                    high_gaps[i] += 1
+        return min_sum, high_gaps
+    return kernel
+
+# Career Explorer "Sort by" labels -> get_career_matches sort_by
+MATCH_SORT_KEYS = {
+    "Salary (High to Low)": "salary",
+    "Growth Rate": "growth",
+    "Time to Entry": "time_to_entry",
+}
+
+# Career Explorer table columns, in display order, keyed by get_career_matches fields
+EXPLORER_COLUMNS = {
+    "career": st.column_config.TextColumn("Career"),
+    "category": st.column_config.TextColumn("Industry"),
+    "match_pct": st.column_config.ProgressColumn("Match", min_value=0, max_value=100, format="%.0f%%"),
+    "salary": st.column_config.NumberColumn("Median Salary", format="$%d"),
+    "growth": st.column_config.NumberColumn("Growth Rate", format="%d%%"),
+    "high_skill_gaps": st.column_config.NumberColumn("High-Priority Gaps"),
+    "education": st.column_config.TextColumn("Education"),
+    "time_to_entry": st.column_config.TextColumn("Time to Entry"),
+}
+
+@st.cache_resource
+def _sort_ranks():
+    """Dense rank per career for each non-match sort_by, ascending in display order; built once"""
+    ranks = {
+        "salary": np.unique(-SALARY, return_inverse=True)[1],
+        "growth": np.unique(-GROWTH, return_inverse=True)[1],
+        "time_to_entry": np.unique(TIME_TO_ENTRY, return_inverse=True)[1],
+    }
+    for arr in ranks.values():
+        arr.flags.writeable = False
+    return ranks
+
+@st.cache_resource
+def _industry_rows(industries):
+    """Ascending career rows in the given tuple of industries; cached per filter selection"""
+    wanted = [CATEGORY_ID[cat] for cat in industries if cat in CATEGORY_ID]
+    rows = np.flatnonzero(np.isin(CATEGORY_IDS, wanted))
+    rows.flags.writeable = False
+    return rows
+
+def get_career_matches(user_skills, target_industries, sort_by="match"):
+    """Get careers that match user skills and target industries, best match first; sort_by reorders stably"""
+    user_vec = _user_vector(user_skills)
+    
+    # Match score and high-priority gap count for every career in one pass.
+    # Weighting min(user/required, 1) by required/100 reduces to
+    # sum(min(user, required)) / sum(required), which stays exact in integers,
+    # so equally matched careers tie exactly.
+    min_sum, high_gaps = _match_kernel()(user_vec, REQ, _HIGH_GAP_THRESHOLD)
+    match_pct = np.divide(min_sum, REQ_TOTAL, out=np.zeros_like(REQ_TOTAL), where=REQ_TOTAL > 0)
+    match_pct *= 100
     
-    matches.sort(key=lambda x: x["match_pct"], reverse=True)
+    rows = _industry_rows(tuple(target_industries))
+    # Match order, or the precomputed key rank with match (then row) breaking ties:
+    # one stable sort either way, same order as sorting by match then by the key
+    rank = _sort_ranks().get(sort_by)
+    if rank is None:
+        rows = rows[np.argsort(-match_pct[rows], kind="stable")]
+    else:
+        rows = rows[np.lexsort((-match_pct[rows], rank[rows]))]
+    
+    matches = []
+    for row in rows:
+        career = CAREER_NAMES[row]
+        data = CAREER_DATA[career]
+        matches.append({
+            "career": career,
+            "category": data.category,
+            "match_pct": float(match_pct[row]),
+            "salary": int(SALARY[row]),
+            "growth": int(GROWTH[row]),
+            "high_skill_gaps": int(high_gaps[row]),
+            "education": data.education,
+            "time_to_entry": data.time_to_entry
+        })
     return matches
 
-def create_skill_radar(careers_to_compare, user_skills=None, title="Skill Comparison"):
-    """Create radar chart with optional user skills overlay"""
+@st.cache_resource
+def _radar_layout():
+    """Static part of the radar layout; built once and never mutated"""
+    return dict(
+        polar=dict(
+            radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(color='white')),
+            angularaxis=dict(tickfont=dict(color='white', size=10)),
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        showlegend=True,
+        legend=dict(font=dict(color='white'), bgcolor='rgba(0,0,0,0.5)'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=500
+    )
+
+@st.cache_data(max_entries=64)
+def create_skill_radar(careers_to_compare, skills_key=None, title="Skill Comparison"):
+    """Create radar chart with optional user skills overlay; skills_key is sorted (skill, level) pairs"""
     fig = go.Figure()
     
-    skills = list(SKILLS_DATA.keys())
-    
-    colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#2ecc71']
-    
     # Add user skills if provided
-    if user_skills:
-        values = [user_skills.get(skill, 0) for skill in skills]
-        values.append(values[0])
-        skills_closed = skills + [skills[0]]
+    if skills_key:
+        user_skills = dict(skills_key)
+        values = [user_skills.get(skill, 0) for skill in SKILL_KEYS_CLOSED]
         
         fig.add_trace(go.Scatterpolar(
             r=values,
-            theta=skills_closed,
+            theta=SKILL_KEYS_CLOSED,
             fill='toself',
-            fillcolor='rgba(46, 204, 113, 0.2)',
+            fillcolor=USER_TRACE_FILL,
             name="Your Skills",
-            line=dict(color='#2ecc71', width=3, dash='dash')
+            line=dict(color=USER_TRACE_COLOR, width=3, dash='dash')
         ))
     
     # Add career skills
     for i, career in enumerate(careers_to_compare[:4]):
         if career in CAREER_DATA:
-            values = [CAREER_DATA[career]["skills"].get(skill, 0) for skill in skills]
-            values.append(values[0])
-            skills_closed = skills + [skills[0]]
-            
-            color = colors[i % len(colors)]
-            
             fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=skills_closed,
+                r=CAREER_RADAR_VALUES[career],
+                theta=SKILL_KEYS_CLOSED,
                 fill='toself',
-                fillcolor=hex_to_rgba(color, 0.2),
+                fillcolor=PALETTE_RGBA[i % len(PALETTE_RGBA)],
                 name=career,
-                line=dict(color=color, width=2)
+                line=dict(color=RADAR_COLORS[i % len(RADAR_COLORS)], width=2)
             ))
     
+    fig.update_layout(**_radar_layout(), title=dict(text=title, font=dict(color='white', size=16)))
+    
+    return fig
+
+@st.cache_data(max_entries=64)
+def _build_gap_bar(skills, user_levels, required_levels):
+    """Overlaid user vs required bars from aligned column arrays, largest gap first"""
+    # Horizontal bar chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=skills,
+        x=user_levels,
+        name='Your Level',
+        orientation='h',
+        marker_color='#2ecc71'
+    ))
+    
+    fig.add_trace(go.Bar(
+        y=skills,
+        x=required_levels,
+        name='Required',
+        orientation='h',
+        marker_color='#3498db',
+        opacity=0.5
+    ))
+    
     fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(color='white')),
-            angularaxis=dict(tickfont=dict(color='white', size=10)),
-            bgcolor='rgba(0,0,0,0)'
-        ),
-        showlegend=True,
-        legend=dict(font=dict(color='white'), bgcolor='rgba(0,0,0,0.5)'),
-        title=dict(text=title, font=dict(color='white', size=16)),
+        barmode='overlay',
+        height=400,
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
-        height=500
+        font=dict(color='white'),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02)
     )
     
     return fig
 
-def generate_consultation_response(user_message, user_profile, skill_gaps):
-    """Generate intelligent career consultation response"""
-    message_lower = user_message.lower()
-    
-    # Get user context
-    target_careers = user_profile.get('target_careers', [])
-    current_role = user_profile.get('current_role', 'Not specified')
-    
-    if "roi" in message_lower or "worth" in message_lower or "invest" in message_lower:
-        # ROI-focused response
-        response = """## 📊 Skill Investment ROI Analysis
-
-Based on your profile, here are the skills with the **highest ROI** for your goals:
-
-"""
-        if skill_gaps:
-            sorted_gaps = sorted(skill_gaps.items(), key=lambda x: x[1]['gap'], reverse=True)[:3]
-            for skill, gap_info in sorted_gaps:
-                if skill in SKILLS_DATA:
-                    premium = SKILLS_DATA[skill]['salary_premium']
-                    response += f"""**{skill}** (Gap: {gap_info['gap']} points)
-- 💰 Salary Premium: +${premium:,}/year at high proficiency
-- 📈 Demand: {SKILLS_DATA[skill]['demand_trend']}
-- ⏱️ Top Course: {SKILLS_DATA[skill]['courses'][0]['name']}
+# Message keywords per intent, checked in order; the first pattern found picks the reply.
+# Plain alternations (no word boundaries) so "courses" or "investment" still match.
+_INTENT_PATTERNS = {
+    "roi": re.compile(r"roi|worth|invest"),
+    "course": re.compile(r"course|learn|train"),
+    "gap": re.compile(r"gap|improve|weak"),
+    "salary": re.compile(r"salary|money|earn"),
+}
 
-"""
-        
-        response += """
-**ROI Formula Used:**
-`Skill ROI = (Salary Premium × Improvement %) / Course Cost`
+# Per-item reply lines, compiled once; headers and footers stay literal in each handler
+_ROI_SKILL_TMPL = Template("**$skill** (Gap: $gap points)\n$bullets\n")
+_COURSE_SKILL_TMPL = Template("### $skill (Priority: High)")
+_COURSE_LINE_TMPL = Template("- **$name** | $cost | $duration | ROI: $roi%")
+_GAP_LINE_TMPL = Template("$emoji **$skill**: You're at $user_level%, need $required_level% (Gap: $gap points)")
+_SALARY_CAREER_TMPL = Template("**$career**\n- Median Salary: $salary\n- Growth Rate: $growth%\n- Education: $education\n")
 
-The skills listed above offer the best return based on your current gaps and market demand."""
-        return response
+def _consult_roi(skill_gaps, sorted_gaps, target_careers, current_role):
+    """ROI-focused reply: best-return skills among the largest gaps"""
+    parts = [
+        "## 📊 Skill Investment ROI Analysis",
+        "",
+        "Based on your profile, here are the skills with the **highest ROI** for your goals:",
+        "",
+    ]
+    if skill_gaps:
+        for skill, gap_info in sorted_gaps[:3]:
+            if skill in SKILLS_DATA:
+                parts.append(_ROI_SKILL_TMPL.substitute(skill=skill, gap=gap_info['gap'], bullets=_skill_roi_md(skill)))
     
-    elif "course" in message_lower or "learn" in message_lower or "train" in message_lower:
-        response = """## 📚 Recommended Learning Path
+    parts += [
+        "",
+        "**ROI Formula Used:**",
+        "`Skill ROI = (Salary Premium × Improvement %) / Course Cost`",
+        "",
+        "The skills listed above offer the best return based on your current gaps and market demand.",
+    ]
+    return "\n".join(parts)
 
-Based on your skill gaps, here's your **prioritized learning plan**:
-
-"""
-        if skill_gaps:
-            high_priority = [(s, g) for s, g in skill_gaps.items() if g['priority'] == 'High'][:2]
-            for skill, gap_info in high_priority:
-                if skill in SKILLS_DATA:
-                    courses = SKILLS_DATA[skill]['courses']
-                    response += f"""### {skill} (Priority: High)
-"""
-                    for course in courses[:2]:
-                        cost_str = "Free" if course['cost'] == 0 else f"${course['cost']}"
-                        response += f"- **{course['name']}** | {cost_str} | {course['duration']} | ROI: {course['roi']}%\n"
-                    response += "\n"
-        
-        response += """
-**Pro Tip:** Start with free courses to validate interest before investing in paid programs."""
-        return response
+def _consult_course(skill_gaps, sorted_gaps, target_careers, current_role):
+    """Learning path: top courses for high-priority gaps"""
+    parts = [
+        "## 📚 Recommended Learning Path",
+        "",
+        "Based on your skill gaps, here's your **prioritized learning plan**:",
+        "",
+    ]
+    if skill_gaps:
+        high_priority = [(s, g) for s, g in skill_gaps.items() if g['priority'] == 'High'][:2]
+        for skill, gap_info in high_priority:
+            if skill in SKILLS_DATA:
+                parts.append(_COURSE_SKILL_TMPL.substitute(skill=skill))
+                for course in SKILLS_DATA[skill]['courses'][:2]:
+                    cost_str = "Free" if course['cost'] == 0 else f"${course['cost']}"
+                    parts.append(_COURSE_LINE_TMPL.substitute(course, cost=cost_str))
+                parts.append("")
     
-    elif "gap" in message_lower or "improve" in message_lower or "weak" in message_lower:
-        response = """## 🎯 Your Skill Gap Analysis
+    parts += [
+        "",
+        "**Pro Tip:** Start with free courses to validate interest before investing in paid programs.",
+    ]
+    return "\n".join(parts)
 
-"""
-        if skill_gaps:
-            for skill, gap_info in sorted(skill_gaps.items(), key=lambda x: x[1]['gap'], reverse=True):
-                if gap_info['gap'] > 0:
-                    priority_emoji = "🔴" if gap_info['priority'] == 'High' else "🟡" if gap_info['priority'] == 'Medium' else "🟢"
-                    response += f"""{priority_emoji} **{skill}**: You're at {gap_info['user_level']}%, need {gap_info['required_level']}% (Gap: {gap_info['gap']} points)
-"""
-        
-        response += """
-**Action Plan:**
-1. Focus on 🔴 High priority gaps first
-2. Aim for 10-15 point improvements per quarter
-3. Use the Courses tab for specific recommendations"""
-        return response
+def _consult_gap(skill_gaps, sorted_gaps, target_careers, current_role):
+    """Every open gap, largest first, with an action plan"""
+    parts = ["## 🎯 Your Skill Gap Analysis", ""]
+    if skill_gaps:
+        for skill, gap_info in sorted_gaps:
+            if gap_info['gap'] > 0:
+                priority_emoji = "🔴" if gap_info['priority'] == 'High' else "🟡" if gap_info['priority'] == 'Medium' else "🟢"
+                parts.append(_GAP_LINE_TMPL.substitute(gap_info, emoji=priority_emoji, skill=skill))
     
-    elif "salary" in message_lower or "money" in message_lower or "earn" in message_lower:
-        response = """## 💰 Salary & Earnings Analysis
-
-"""
-        if target_careers:
-            for career in target_careers[:3]:
-                if career in CAREER_DATA:
-                    data = CAREER_DATA[career]
-                    response += f"""**{career}**
-- Median Salary: ${data['median_salary']:,}
-- Growth Rate: {data['growth_rate']}%
-- Education: {data['education']}
+    parts += [
+        "",
+        "**Action Plan:**",
+        "1. Focus on 🔴 High priority gaps first",
+        "2. Aim for 10-15 point improvements per quarter",
+        "3. Use the Courses tab for specific recommendations",
+    ]
+    return "\n".join(parts)
 
-"""
-        
-        response += """**Salary Boosters:**
-- Each high-demand skill at expert level adds $5K-$15K
-- Leadership roles add 20-40% to base
-- Certifications can add 10-20% premium"""
-        return response
+def _consult_salary(skill_gaps, sorted_gaps, target_careers, current_role):
+    """Median salary and growth for the target careers"""
+    parts = ["## 💰 Salary & Earnings Analysis", ""]
+    if target_careers:
+        for career in target_careers[:3]:
+            if career in CAREER_DATA:
+                data = CAREER_DATA[career]
+                parts.append(_SALARY_CAREER_TMPL.substitute(
+                    career=career, salary=_fmt_salary(data.median_salary),
+                    growth=data.growth_rate, education=data.education
+                ))
     
-    else:
-        # General helpful response
-        return f"""## 🤖 Career Consultation
+    parts += [
+        "**Salary Boosters:**",
+        "- Each high-demand skill at expert level adds $5K-$15K",
+        "- Leadership roles add 20-40% to base",
+        "- Certifications can add 10-20% premium",
+    ]
+    return "\n".join(parts)
 
-I'm here to help you navigate your career journey! Based on your profile:
+def _consult_general(skill_gaps, sorted_gaps, target_careers, current_role):
+    """General help listing the questions the consultant understands"""
+    return "\n".join([
+        "## 🤖 Career Consultation",
+        "",
+        "I'm here to help you navigate your career journey! Based on your profile:",
+        "",
+        f"**Current Role:** {current_role}",
+        f"**Target Careers:** {', '.join(target_careers[:3]) if target_careers else 'Not yet selected'}",
+        "",
+        "**Quick Actions:**",
+        '1. 📊 Ask about "skill ROI" to see which skills offer the best return',
+        '2. 📚 Ask about "courses" for personalized learning recommendations  ',
+        '3. 🎯 Ask about "skill gaps" for detailed improvement areas',
+        '4. 💰 Ask about "salary" for earnings analysis',
+        "",
+        "**Example Questions:**",
+        '- "What skills should I focus on for the best ROI?"',
+        '- "What courses do you recommend for my gaps?"',
+        '- "How can I increase my salary potential?"',
+        "",
+        "What would you like to explore?",
+    ])
 
-**Current Role:** {current_role}
-**Target Careers:** {', '.join(target_careers[:3]) if target_careers else 'Not yet selected'}
+_CONSULT_HANDLERS = {
+    "roi": _consult_roi,
+    "course": _consult_course,
+    "gap": _consult_gap,
+    "salary": _consult_salary,
+    None: _consult_general,
+}
+
+_GAP_FIELDS = ("user_level", "required_level", "gap", "priority")
 
-**Quick Actions:**
-1. 📊 Ask about "skill ROI" to see which skills offer the best return
-2. 📚 Ask about "courses" for personalized learning recommendations  
-3. 🎯 Ask about "skill gaps" for detailed improvement areas
-4. 💰 Ask about "salary" for earnings analysis
+def _detect_intent(message):
+    """First _INTENT_PATTERNS key found in the message, or None for the general reply"""
+    message_lower = message.lower()
+    return next((name for name, pattern in _INTENT_PATTERNS.items() if pattern.search(message_lower)), None)
 
-**Example Questions:**
-- "What skills should I focus on for the best ROI?"
-- "What courses do you recommend for my gaps?"
-- "How can I increase my salary potential?"
+@st.cache_data(ttl=1800, max_entries=512)
+def _consult_cached(intent, target_careers, gaps_key, gaps_order, current_role):
+    """Reply markdown for one (intent, careers, gaps, role) state; gaps_key keeps dict order"""
+    skill_gaps = {skill: dict(zip(_GAP_FIELDS, values)) for skill, *values in gaps_key}
+    sorted_gaps = [(skill, skill_gaps[skill]) for skill in gaps_order]
+    return _CONSULT_HANDLERS[intent](skill_gaps, sorted_gaps, list(target_careers), current_role)
 
-What would you like to explore?"""
+def generate_consultation_response(user_message, user_profile, skill_gaps, gaps_sorted=None):
+    """Generate intelligent career consultation response; gaps_sorted is skill_gaps items by gap, largest first"""
+    intent = _detect_intent(user_message)
+    
+    # Get user context, normalised to hashables for the reply cache
+    target_careers = tuple(user_profile.get('target_careers', []))
+    current_role = user_profile.get('current_role', 'Not specified')
+    gaps_key = tuple(
+        (skill, *(info[field] for field in _GAP_FIELDS)) for skill, info in skill_gaps.items()
+    )
+    
+    if gaps_sorted is None:
+        gaps_sorted = sorted(skill_gaps.items(), key=lambda x: -x[1]['gap'])
+    gaps_order = tuple(skill for skill, _ in gaps_sorted)
+    
+    return _consult_cached(intent, target_careers, gaps_key, gaps_order, current_role)
 
 # =============================================================================
 # MAIN APPLICATION
@@ -916,30 +1240,31 @@ if not st.session_state.onboarding_complete:
     elif st.session_state.onboarding_step == 1:
         st.markdown("### 📍 Step 1: Where Are You Now?")
         
-        current_role = st.text_input(
-            "What's your current role or situation?",
-            placeholder="e.g., Marketing Coordinator, CS Student, Looking for first job..."
-        )
-        
-        years_exp = st.slider("Years of Work Experience", 0, 30, 2)
-        
-        user_type = st.selectbox(
-            "Which best describes you?",
-            ["University Student", "Recent Graduate", "Working Professional", "Career Changer", "Returning to Workforce"]
-        )
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("← Back"):
-                st.session_state.onboarding_step = 0
-                st.rerun()
-        with col2:
-            if st.button("Next →", type="primary"):
+        # A form, so editing the fields doesn't rerun the script until Next
+        with st.form("situation"):
+            current_role = st.text_input(
+                "What's your current role or situation?",
+                placeholder="e.g., Marketing Coordinator, CS Student, Looking for first job..."
+            )
+            
+            years_exp = st.slider("Years of Work Experience", 0, 30, 2)
+            
+            user_type = st.selectbox(
+                "Which best describes you?",
+                ["University Student", "Recent Graduate", "Working Professional", "Career Changer", "Returning to Workforce"]
+            )
+            
+            if st.form_submit_button("Next →", type="primary"):
                 st.session_state.user_profile['current_role'] = current_role
                 st.session_state.user_profile['years_exp'] = years_exp
                 st.session_state.user_profile['user_type'] = user_type
                 st.session_state.onboarding_step = 2
                 st.rerun()
+        
+        # Forms only hold submit buttons, so Back lives outside
+        if st.button("← Back"):
+            st.session_state.onboarding_step = 0
+            st.rerun()
     
     # STEP 2: Target Industries & Careers
     elif st.session_state.onboarding_step == 2:
@@ -952,11 +1277,8 @@ if not st.session_state.onboarding_complete:
         )
         
         # Show careers from selected industries
-        available_careers = []
-        for ind in target_industries:
-            for career, data in CAREER_DATA.items():
-                if data["category"] == ind:
-                    available_careers.append(career)
+        careers_by_category = _careers_by_category()
+        available_careers = [career for ind in target_industries for career in careers_by_category.get(ind, ())]
         
         if available_careers:
             target_careers = st.multiselect(
@@ -1000,62 +1322,67 @@ if not st.session_state.onboarding_complete:
         - 76-100: Expert (highly skilled, could teach others)
         """)
         
-        skill_cols = st.columns(2)
-        for i, (skill, info) in enumerate(SKILLS_DATA.items()):
-            with skill_cols[i % 2]:
-                st.session_state.user_skills[skill] = st.slider(
-                    f"{skill}",
-                    0, 100, 
-                    st.session_state.user_skills.get(skill, 50),
-                    help=info["description"],
-                    key=f"onboard_skill_{skill}"
-                )
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("← Back"):
-                st.session_state.onboarding_step = 2
-                st.rerun()
-        with col2:
-            if st.button("Next →", type="primary"):
+        # Sliders batch inside a form: one rerun on Next instead of one per drag
+        with st.form("skill_assessment"):
+            skill_cols = st.columns(2)
+            levels = {}
+            skill_help = _skill_help_map()
+            for i, skill in enumerate(SKILL_KEYS):
+                with skill_cols[i % 2]:
+                    levels[skill] = st.slider(
+                        f"{skill}",
+                        0, 100, 
+                        st.session_state.user_skills.get(skill, 50),
+                        help=skill_help[skill],
+                        key=f"onboard_skill_{skill}"
+                    )
+            
+            if st.form_submit_button("Next →", type="primary"):
+                st.session_state.user_skills.update(levels)
                 st.session_state.onboarding_step = 4
                 st.rerun()
+        
+        if st.button("← Back"):
+            st.session_state.onboarding_step = 2
+            st.rerun()
     
     # STEP 4: Values & Priorities
     elif st.session_state.onboarding_step == 4:
         st.markdown("### ⭐ Step 4: Your Values & Priorities")
         
-        work_values = st.multiselect(
-            "What's most important to you in work? (Pick up to 3)",
-            ["High Salary", "Work-Life Balance", "Making an Impact", "Job Security", 
-             "Creativity", "Leadership Opportunities", "Flexibility", "Continuous Learning",
-             "Team Environment", "Independence"],
-            max_selections=3
-        )
-        
-        life_priority = st.text_input(
-            "Outside of work, what's most important to you?",
-            placeholder="e.g., Family time, Travel, Health, Hobbies..."
-        )
-        
-        st.markdown("---")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("← Back"):
-                st.session_state.onboarding_step = 3
-                st.rerun()
-        with col2:
-            if st.button("🎉 Complete Assessment", type="primary"):
+        with st.form("values"):
+            work_values = st.multiselect(
+                "What's most important to you in work? (Pick up to 3)",
+                ["High Salary", "Work-Life Balance", "Making an Impact", "Job Security", 
+                 "Creativity", "Leadership Opportunities", "Flexibility", "Continuous Learning",
+                 "Team Environment", "Independence"],
+                max_selections=3
+            )
+            
+            life_priority = st.text_input(
+                "Outside of work, what's most important to you?",
+                placeholder="e.g., Family time, Travel, Health, Hobbies..."
+            )
+            
+            st.markdown("---")
+            
+            if st.form_submit_button("🎉 Complete Assessment", type="primary"):
                 st.session_state.user_profile['work_values'] = work_values
                 st.session_state.user_profile['life_priority'] = life_priority
                 st.session_state.onboarding_complete = True
                 st.rerun()
+        
+        if st.button("← Back"):
+            st.session_state.onboarding_step = 3
+            st.rerun()
 
 # =============================================================================
 # MAIN DASHBOARD (after onboarding)
 # =============================================================================
 else:
+    # Hashable snapshot of the user's skills for the sidebar stats and cached gap lookups below
+    skills_key = tuple(sorted(st.session_state.user_skills.items()))
+    
     # Sidebar with profile summary
     with st.sidebar:
         st.markdown("### 👤 Your Profile")
@@ -1073,16 +1400,33 @@ else:
         st.markdown("---")
         st.markdown("### 📊 Quick Stats")
         
-        # Calculate overall readiness
+        # Calculate overall readiness, only when skills or targets changed since the last run
         target_careers = st.session_state.target_careers
         if target_careers:
-            avg_match = np.mean([
-                sum(min(st.session_state.user_skills.get(s, 0) / r, 1) 
-                    for s, r in CAREER_DATA[c]["skills"].items()) / len(CAREER_DATA[c]["skills"]) * 100
-                for c in target_careers if c in CAREER_DATA
-            ])
+            stats_key = (tuple(target_careers), skills_key)
+            if st.session_state.get('_stats_key') == stats_key:
+                avg_match = st.session_state._stats_value
+            else:
+                # Mean of min(user / required, 1) over each career's REQ row, averaged over careers.
+                # cumsum adds left to right like the per-skill loop did, so the metric rounds the same.
+                rows = [CAREER_ROW[c] for c in target_careers if c in CAREER_DATA]
+                ratios = np.minimum(_user_vector(st.session_state.user_skills).astype(np.float64) / REQ[rows], 1)
+                avg_match = np.mean(ratios.cumsum(axis=1)[:, -1] / len(SKILL_KEYS) * 100)
+                st.session_state._stats_key = stats_key
+                st.session_state._stats_value = avg_match
             st.metric("Career Readiness", f"{avg_match:.0f}%")
     
+    # Gaps per target career, and the largest gap per skill across them; shared by every tab
+    gaps_by_career = {
+        career: _cached_gaps(career, skills_key)
+        for career in st.session_state.target_careers if career in CAREER_DATA
+    }
+    merged_gaps = {}
+    for gaps in gaps_by_career.values():
+        for skill, info in gaps.items():
+            if skill not in merged_gaps or info['gap'] > merged_gaps[skill]['gap']:
+                merged_gaps[skill] = info
+    
     # Main content tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📊 My Dashboard",
@@ -1093,11 +1437,12 @@ else:
     ])
     
     # TAB 1: DASHBOARD
-    with tab1:
+    @st.fragment
+    def _tab_dashboard(gaps_by_career, skills_key):
+        """Target career cards and the skills radar"""
         st.markdown("## 📊 Your Personalized Dashboard")
         
         target_careers = st.session_state.target_careers
-        user_skills = st.session_state.user_skills
         
         if target_careers:
             # Top career matches
@@ -1107,95 +1452,68 @@ else:
             for i, career in enumerate(target_careers):
                 if career in CAREER_DATA:
                     data = CAREER_DATA[career]
-                    gaps = calculate_skill_gaps(user_skills, career)
+                    gaps = gaps_by_career[career]
                     match_pct = 100 - (sum(g['gap'] for g in gaps.values()) / len(gaps) / 100 * 100)
                     high_gaps = sum(1 for g in gaps.values() if g['priority'] == 'High')
                     
                     with cols[i]:
-                        cat_class = f"category-{data['category'].lower()}"
-                        st.markdown(f'<span class="{cat_class}">{data["category"]}</span>', unsafe_allow_html=True)
+                        st.markdown(f'<span class="{_CAT_CLASS[data.category]}">{data.category}</span>', unsafe_allow_html=True)
                         st.markdown(f"**{career}**")
                         st.metric("Match", f"{match_pct:.0f}%")
-                        st.metric("Salary", f"${data['median_salary']:,}")
+                        st.metric("Salary", _fmt_salary(data.median_salary))
                         st.caption(f"🔴 {high_gaps} high-priority skill gaps")
             
             st.markdown("---")
             
             # Skill comparison radar
             st.markdown("### 📈 Your Skills vs Target Careers")
-            fig = create_skill_radar(target_careers, user_skills, "Skills Comparison")
-            st.plotly_chart(fig, use_container_width=True)
+            fig = create_skill_radar(tuple(target_careers), skills_key, "Skills Comparison")
+            # Keep hover on the radar, but skip the mode bar and client-side resize handling
+            st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False, "responsive": False})
             st.caption("🟢 Dashed line = Your current skills | Solid lines = Career requirements")
             
         else:
             st.info("👆 Go back to the assessment to select target careers and see your personalized dashboard.")
     
+    with tab1:
+        _tab_dashboard(gaps_by_career, skills_key)
+    
     # TAB 2: SKILL GAPS & ROI
-    with tab2:
+    @st.fragment
+    def _tab_gaps(gaps_by_career):
+        """Gap chart and skill ROI for one selected target career"""
         st.markdown("## 🎯 Skill Gap Analysis & ROI")
         
         target_careers = st.session_state.target_careers
-        user_skills = st.session_state.user_skills
         
         if target_careers:
             selected_career = st.selectbox("Analyze gaps for:", target_careers)
             
             if selected_career and selected_career in CAREER_DATA:
-                gaps = calculate_skill_gaps(user_skills, selected_career)
+                gaps = gaps_by_career[selected_career]
+                
+                # One stable sort by gap, largest first, shared by the chart and the ROI column
+                gap_items = list(gaps.items())
+                skills = np.array(list(gaps))
+                user_levels = np.fromiter((g['user_level'] for g in gaps.values()), dtype=np.int64, count=len(gaps))
+                required_levels = np.fromiter((g['required_level'] for g in gaps.values()), dtype=np.int64, count=len(gaps))
+                gap_sizes = np.fromiter((g['gap'] for g in gaps.values()), dtype=np.int64, count=len(gaps))
+                order = np.argsort(-gap_sizes, kind="stable")
                 
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
                     st.markdown(f"### Skill Gaps for {selected_career}")
                     
-                    # Create gap visualization
-                    gap_data = []
-                    for skill, info in sorted(gaps.items(), key=lambda x: x[1]['gap'], reverse=True):
-                        gap_data.append({
-                            "Skill": skill,
-                            "Your Level": info['user_level'],
-                            "Required": info['required_level'],
-                            "Gap": info['gap'],
-                            "Priority": info['priority']
-                        })
-                    
-                    df = pd.DataFrame(gap_data)
-                    
-                    # Horizontal bar chart
-                    fig = go.Figure()
-                    
-                    fig.add_trace(go.Bar(
-                        y=df['Skill'],
-                        x=df['Your Level'],
-                        name='Your Level',
-                        orientation='h',
-                        marker_color='#2ecc71'
-                    ))
-                    
-                    fig.add_trace(go.Bar(
-                        y=df['Skill'],
-                        x=df['Required'],
-                        name='Required',
-                        orientation='h',
-                        marker_color='#3498db',
-                        opacity=0.5
-                    ))
-                    
-                    fig.update_layout(
-                        barmode='overlay',
-                        height=400,
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color='white'),
-                        legend=dict(orientation='h', yanchor='bottom', y=1.02)
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    # Create gap visualization from aligned columns
+                    fig = _build_gap_bar(skills[order], user_levels[order], required_levels[order])
+                    # Informational only: a static plot skips Plotly.js hover/zoom setup
+                    st.plotly_chart(fig, use_container_width=True, config={"staticPlot": True})
                 
                 with col2:
                     st.markdown("### 💰 Skill ROI")
                     
-                    for skill, info in sorted(gaps.items(), key=lambda x: x[1]['gap'], reverse=True)[:5]:
+                    for skill, info in (gap_items[k] for k in order[:5]):
                         if info['gap'] > 0 and skill in SKILLS_DATA:
                             roi_info = calculate_skill_roi(skill, info['user_level'], info['required_level'])
                             
@@ -1210,25 +1528,23 @@ else:
         else:
             st.info("Select target careers in the assessment to see your skill gaps.")
     
+    with tab2:
+        _tab_gaps(gaps_by_career)
+    
     # TAB 3: COURSE RECOMMENDATIONS
-    with tab3:
+    @st.fragment
+    def _tab_courses(merged_gaps):
+        """Courses for every open gap, high priority first"""
         st.markdown("## 📚 Personalized Course Recommendations")
         
         target_careers = st.session_state.target_careers
-        user_skills = st.session_state.user_skills
         
         if target_careers:
             # Get all high-priority gaps
-            all_gaps = {}
-            for career in target_careers:
-                if career in CAREER_DATA:
-                    gaps = calculate_skill_gaps(user_skills, career)
-                    for skill, info in gaps.items():
-                        if skill not in all_gaps or info['gap'] > all_gaps[skill]['gap']:
-                            all_gaps[skill] = info
+            all_gaps = merged_gaps
             
             # Sort by priority and gap size
-            priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
+            priority_order = _priority_order()
             sorted_gaps = sorted(all_gaps.items(), 
                                 key=lambda x: (priority_order[x[1]['priority']], -x[1]['gap']))
             
@@ -1241,7 +1557,7 @@ else:
                     with st.expander(f"**{skill}** - Gap: {gap_info['gap']} pts | Priority: {gap_info['priority']}", expanded=(gap_info['priority']=='High')):
                         st.markdown(f"**Description:** {skill_info['description']}")
                         st.markdown(f"**Demand Trend:** {skill_info['demand_trend']}")
-                        st.markdown(f"**Salary Premium at Mastery:** +${skill_info['salary_premium']:,}/year")
+                        st.markdown(f"**Salary Premium at Mastery:** +{_fmt_salary(skill_info['salary_premium'])}/year")
                         
                         st.markdown("#### Recommended Courses:")
                         for course in skill_info['courses']:
@@ -1253,8 +1569,13 @@ else:
         else:
             st.info("Select target careers to get personalized course recommendations.")
     
+    with tab3:
+        _tab_courses(merged_gaps)
+    
     # TAB 4: CAREER EXPLORER
-    with tab4:
+    @st.fragment
+    def _tab_explorer():
+        """Filterable, sortable list of career matches"""
         st.markdown("## 🔍 Career Explorer")
         
         # Filter options
@@ -1272,74 +1593,71 @@ else:
             )
         
         # Get and display matches
-        matches = get_career_matches(st.session_state.user_skills, filter_categories)
-        
-        if sort_by == "Salary (High to Low)":
-            matches.sort(key=lambda x: x['salary'], reverse=True)
-        elif sort_by == "Growth Rate":
-            matches.sort(key=lambda x: x['growth'], reverse=True)
-        elif sort_by == "Time to Entry":
-            matches.sort(key=lambda x: x['time_to_entry'])
+        matches = get_career_matches(
+            st.session_state.user_skills, filter_categories,
+            sort_by=MATCH_SORT_KEYS.get(sort_by, "match")
+        )
         
         st.markdown(f"### Showing {len(matches)} Careers")
         
-        for match in matches:
-            with st.expander(f"**{match['career']}** | Match: {match['match_pct']:.0f}% | ${match['salary']:,}"):
+        # One table for all matches; picking a row opens its details below
+        event = st.dataframe(
+            pd.DataFrame.from_records(matches, columns=list(EXPLORER_COLUMNS)),
+            column_config=EXPLORER_COLUMNS,
+            hide_index=True,
+            width="stretch",
+            on_select="rerun",
+            selection_mode="single-row",
+            # A row index only means something for one sort and filter, so a new
+            # sort or filter gets a fresh widget and drops the old selection
+            key=f"explorer_table:{sort_by}:{'|'.join(filter_categories)}"
+        )
+        
+        if event.selection.rows:
+            match = matches[event.selection.rows[0]]
+            with st.expander(f"**{match['career']}** | Match: {match['match_pct']:.0f}% | {_fmt_salary(match['salary'])}", expanded=True):
                 data = CAREER_DATA[match['career']]
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Median Salary", f"${match['salary']:,}")
+                    st.metric("Median Salary", _fmt_salary(match['salary']))
                     st.metric("Growth Rate", f"{match['growth']}%")
                 with col2:
                     st.metric("Match Score", f"{match['match_pct']:.0f}%")
                     st.metric("Skill Gaps", f"{match['high_skill_gaps']} high priority")
                 with col3:
                     st.write(f"**Education:** {match['education']}")
-                    st.write(f"**Time to Entry:** {data['time_to_entry']}")
+                    st.write(f"**Time to Entry:** {data.time_to_entry}")
                 
                 st.markdown("**Entry Paths:**")
-                for path in data['entry_paths']:
+                for path in data.entry_paths:
                     st.markdown(f"- {path}")
+        elif matches:
+            st.caption("Select a row to see a career's details and entry paths.")
+    
+    with tab4:
+        _tab_explorer()
     
     # TAB 5: AI CONSULTATION
-    with tab5:
+    @st.fragment
+    def _tab_chat(merged_gaps):
+        """Chat history, free-text questions and quick questions"""
         st.markdown("## 💬 AI Career Consultation")
         st.markdown("*Ask questions about your career path, skills, and opportunities*")
         
-        # Get skill gaps for context
-        skill_gaps = {}
-        if st.session_state.target_careers:
-            for career in st.session_state.target_careers:
-                if career in CAREER_DATA:
-                    gaps = calculate_skill_gaps(st.session_state.user_skills, career)
-                    for skill, info in gaps.items():
-                        if skill not in skill_gaps or info['gap'] > skill_gaps[skill]['gap']:
-                            skill_gaps[skill] = info
+        # Skill gaps for context, sorted once per run for every reply below
+        skill_gaps = merged_gaps
+        gaps_sorted = sorted(skill_gaps.items(), key=lambda x: -x[1]['gap'])
         
-        # Display chat history
-        for msg in st.session_state.chat_history:
-            if msg['role'] == 'user':
-                st.markdown(f"**You:** {msg['content']}")
-            else:
-                st.markdown(msg['content'])
-            st.markdown("---")
+        # Chat history sits above the input but is filled in last, so a reply
+        # sent below shows up in this same fragment run without st.rerun()
+        history = st.container()
         
-        # Chat input
-        user_input = st.text_input("Ask a question:", placeholder="e.g., What skills give me the best ROI?")
+        # Chat input; only emits on Enter, so typing doesn't rerun anything
+        pending_q = st.chat_input("e.g., What skills give me the best ROI?")
         
-        col1, col2, col3 = st.columns([1, 1, 2])
-        with col1:
-            if st.button("Send", type="primary"):
-                if user_input:
-                    st.session_state.chat_history.append({'role': 'user', 'content': user_input})
-                    response = generate_consultation_response(user_input, st.session_state.user_profile, skill_gaps)
-                    st.session_state.chat_history.append({'role': 'assistant', 'content': response})
-                    st.rerun()
-        with col2:
-            if st.button("Clear Chat"):
-                st.session_state.chat_history = []
-                st.rerun()
+        if st.button("Clear Chat"):
+            st.session_state.chat_history.clear()
         
         # Quick questions
         st.markdown("### Quick Questions")
@@ -1354,10 +1672,25 @@ else:
         for i, q in enumerate(quick_questions):
             with quick_cols[i]:
                 if st.button(q, key=f"quick_{i}"):
-                    st.session_state.chat_history.append({'role': 'user', 'content': q})
-                    response = generate_consultation_response(q, st.session_state.user_profile, skill_gaps)
-                    st.session_state.chat_history.append({'role': 'assistant', 'content': response})
-                    st.rerun()
+                    pending_q = q
+        
+        # Answer the one question this run brought in, typed or quick, in one place
+        if pending_q:
+            response = generate_consultation_response(pending_q, st.session_state.user_profile, skill_gaps, gaps_sorted)
+            st.session_state.chat_history.extend((
+                {'role': 'user', 'content': pending_q},
+                {'role': 'assistant', 'content': response},
+            ))
+        
+        # One markdown element for the whole history; each message still ends in a rule
+        if st.session_state.chat_history:
+            history.markdown("".join(
+                f"**You:** {msg['content']}\n\n---\n\n" if msg['role'] == 'user' else f"{msg['content']}\n\n---\n\n"
+                for msg in st.session_state.chat_history
+            ))
+    
+    with tab5:
+        _tab_chat(merged_gaps)
 
 # =============================================================================
 # FOOTER